@@ -10,6 +10,7 @@ from tornado.ioloop import IOLoop
 from multiprocessing import Process, Pipe
 
 from .core import CommClosedError
+from .threadpoolexecutor import ThreadPoolExecutor
 from .utils import parse_timedelta
 
 from random import randint
@@ -55,6 +56,7 @@ class BatchedLambdaInvoker(object):
         self.next_deadline = None
         self.debug_print = debug_print 
         self.lambda_client = None 
+        self.invoke_executor = None
         self.time_spent_invoking = 0
         self.lambda_invokers = []
         self.lambda_pipes = []
@@ -68,6 +70,11 @@ class BatchedLambdaInvoker(object):
     def start(self, lambda_client, scheduler_address):
         print("Starting BatchedLambdaInvoker with interval {}...".format(self.interval))
         self.lambda_client = lambda_client
+        # boto3 clients are thread-safe, so the Scheduler's own share of each batch is invoked
+        # from a pool of threads sharing this client's (keep-alive) connection pool. Using more
+        # threads than pooled connections would just discard connections after each invoke.
+        num_invoke_threads = min(self.num_invokers, lambda_client.meta.config.max_pool_connections)
+        self.invoke_executor = ThreadPoolExecutor(max(1, num_invoke_threads), thread_name_prefix="Dask-Lambda-Invoker")
         self.loop.add_callback(self._background_send)
         self.scheduler_address = scheduler_address
         
@@ -139,15 +146,13 @@ class BatchedLambdaInvoker(object):
                 invoker_index += 1
             try:
                 send_start_time = time.time()
-                # Send each chunk to an invocation of the AWS Lambda function for evaluation.
+                # Send each chunk to an invocation of the AWS Lambda function for evaluation. The invocations
+                # run concurrently off the event loop, so this takes about as long as the slowest single invoke.
                 total_time_spent_serializing = 0
-                total_time_spent_invoking = 0
-                for payload in scheduler_payload:
-                    time_invoke_start = time.time()
-                    self.lambda_client.invoke(FunctionName=self.lambda_function_name, InvocationType='Event', Payload=payload)
-                    time_invoke_end = time.time()
-                    diff_invoke = time_invoke_end - time_invoke_start
-                    total_time_spent_invoking += diff_invoke 
+                time_invoke_start = time.time()
+                yield [self.loop.run_in_executor(self.invoke_executor, self._invoke, payload) for payload in scheduler_payload]
+                time_invoke_end = time.time()
+                total_time_spent_invoking = time_invoke_end - time_invoke_start
                 send_done_time = time.time()
                 
                 self.total_lambdas_invoked = self.total_lambdas_invoked + len(scheduler_payload)
@@ -169,6 +174,12 @@ class BatchedLambdaInvoker(object):
 
         self.stopped.set()
 
+    def _invoke(self, payload):
+        """ Invoke the Lambda function with the given payload.
+
+            The call blocks until AWS accepts the event, so it runs on a thread of ``self.invoke_executor``."""
+        self.lambda_client.invoke(FunctionName=self.lambda_function_name, InvocationType='Event', Payload=payload)
+
     def send(self, msg):
         """ Schedule a task for sending to Lambda
 
@@ -187,6 +198,9 @@ class BatchedLambdaInvoker(object):
         
         self.please_stop = True
         self.waker.set()
+
+        if self.invoke_executor is not None:
+            self.invoke_executor.shutdown(wait=False)
         
         # Terminate each of the processes.
         for process in self.lambda_invokers:
@@ -202,6 +216,9 @@ class BatchedLambdaInvoker(object):
         self.buffer = []
         self.waker.set()
 
+        if self.invoke_executor is not None:
+            self.invoke_executor.shutdown(wait=False)
+
         # Terminate each of the processes.
         for process in self.lambda_invokers:
             process.terminate()
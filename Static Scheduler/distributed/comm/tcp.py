@@ -197,17 +197,32 @@ class TCP(Comm):
             lengths = struct.unpack("Q" * n_frames, lengths)
 
             frames = []
-            for length in lengths:
-                if length:
-                    if PY3 and self._iostream_has_read_into:
-                        frame = bytearray(length)
-                        n = yield stream.read_into(frame)
-                        assert n == length, (n, length)
-                    else:
-                        frame = yield stream.read_bytes(length)
+            total = sum(lengths)
+            if PY3 and 0 < total < 2 ** 17:  # 128kiB, mirrors write()
+                # small enough, receive in one go and split locally
+                if self._iostream_has_read_into:
+                    buf = bytearray(total)
+                    n = yield stream.read_into(buf)
+                    assert n == total, (n, total)
                 else:
-                    frame = b""
-                frames.append(frame)
+                    buf = yield stream.read_bytes(total)
+                start = 0
+                for length in lengths:
+                    # bytearray slices keep frames writeable, e.g. for numpy
+                    frames.append(buf[start : start + length] if length else b"")
+                    start += length
+            else:
+                for length in lengths:
+                    if length:
+                        if PY3 and self._iostream_has_read_into:
+                            frame = bytearray(length)
+                            n = yield stream.read_into(frame)
+                            assert n == length, (n, length)
+                        else:
+                            frame = yield stream.read_bytes(length)
+                    else:
+                        frame = b""
+                    frames.append(frame)
         except StreamClosedError as e:
             self.stream = None
             # print("StreamClosedError...")
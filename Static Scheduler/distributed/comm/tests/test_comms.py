@@ -1083,6 +1083,27 @@ def test_tcp_deserialize_roundtrip():
     yield check_deserialize_roundtrip("tcp://")
 
 
+@gen_test()
+def test_tcp_small_frames():
+    np = pytest.importorskip("numpy")
+
+    # Small messages are received in a single read and split locally
+    a, b = yield get_tcp_comm_pair(deserialize=False)
+    frames = [b"abc", b"", b"defg"]
+    yield a.write({"op": "frames", "ser": Serialized({}, frames)})
+    got = yield b.read()
+    assert [bytes(frame) for frame in got["ser"].frames] == frames
+
+    a, b = yield get_tcp_comm_pair()
+    x = np.arange(10)
+    yield a.write({"op": "array", "x": to_serialize(x)})
+    got = yield b.read()
+    y = got["x"]
+    assert y.flags.writeable
+    y += 1
+    assert (y == x + 1).all()
+
+
 def _raise_eoferror():
     raise EOFError
 
@@ -3,19 +3,34 @@ from __future__ import print_function, division, absolute_import
 import atexit
 import logging
 import math
+import threading
+from types import MappingProxyType
 import warnings
 import weakref
 
 from dask.utils import factors
+import psutil
 
 from .spec import SpecCluster
+from ..diagnostics.memory_sampler import MemorySampler
+from ..metrics import time
 from ..nanny import Nanny
 from ..scheduler import Scheduler
+from ..utils import get_mp_context, lru_cache
 from ..worker import Worker, parse_memory_limit, _ncores
 
 logger = logging.getLogger(__name__)
 
 
+# Default protocol keyed by (secure, in-process with no scheduler port)
+_default_protocols = {
+    (True, True): "tls://",
+    (True, False): "tls://",
+    (False, True): "inproc://",
+    (False, False): "tcp://",
+}
+
+
 class LocalCluster(SpecCluster):
     """ Create local Scheduler and Workers
 
@@ -65,6 +80,32 @@ class LocalCluster(SpecCluster):
         Network interface to use.  Defaults to lo/localhost
     worker_class: Worker
         Worker class used to instantiate workers from.
+    spawn_method: str (optional)
+        Multiprocessing start method used by each Nanny to launch its worker
+        process, one of ``fork``, ``forkserver`` or ``spawn``.  Defaults to
+        the ``distributed.worker.multiprocessing-method`` configuration value
+        (``forkserver``).  Only used when workers run in separate processes.
+    cpu_affinity: bool
+        Whether to pin each worker process to its own block of
+        ``threads_per_worker`` cores, so that workers don't migrate between
+        cores (or sockets on NUMA machines).  False by default.  Only used
+        when workers run in separate processes on platforms that support
+        setting CPU affinity, like Linux and Windows.
+    memory_profile_path: str (optional)
+        If given, record the minimum and maximum memory used by every task in
+        a CSV file at this path, written when workers close.  See
+        ``distributed.diagnostics.memory_sampler.MemorySampler``
+    specs: dict (optional)
+        Specifications built ahead of time by ``LocalCluster.build_specs``.
+        If given, all keywords describing the scheduler and workers are
+        ignored in favor of these specifications.
+    track_for_atexit: bool
+        Whether to close this cluster when the Python process exits, if it is
+        still open.  True by default.  Asynchronous clusters are never
+        tracked, so should be closed explicitly, for example with
+        ``async with LocalCluster(..., asynchronous=True)``.  Services that
+        manage cluster lifetimes themselves can pass False to skip this
+        bookkeeping.
     proxy_and_redis_address: str
         The IP address of both the proxy and the Redis cluster(s)
     proxy_port: int
@@ -120,8 +161,122 @@ class LocalCluster(SpecCluster):
         chunk_large_tasks = False,
         chunk_task_threshold = 50,
         num_chunks_for_large_tasks = None,
+        spawn_method=None,
+        cpu_affinity=False,
+        memory_profile_path=None,
+        track_for_atexit=True,
+        specs=None,
+        **worker_kwargs
+    ):
+        # Keep these defaults in sync with build_specs, see test_build_specs_signature
+        if specs is None:
+            specs = self.build_specs(
+                n_workers=n_workers,
+                threads_per_worker=threads_per_worker,
+                processes=processes,
+                host=host,
+                ip=ip,
+                scheduler_port=scheduler_port,
+                silence_logs=silence_logs,
+                dashboard_address=dashboard_address,
+                worker_dashboard_address=worker_dashboard_address,
+                diagnostics_port=diagnostics_port,
+                services=services,
+                worker_services=worker_services,
+                service_kwargs=service_kwargs,
+                security=security,
+                protocol=protocol,
+                blocked_handlers=blocked_handlers,
+                interface=interface,
+                worker_class=worker_class,
+                proxy_address=proxy_address,
+                proxy_port=proxy_port,
+                redis_endpoints=redis_endpoints,
+                num_lambda_invokers=num_lambda_invokers,
+                max_task_fanout=max_task_fanout,
+                chunk_large_tasks=chunk_large_tasks,
+                chunk_task_threshold=chunk_task_threshold,
+                num_chunks_for_large_tasks=num_chunks_for_large_tasks,
+                spawn_method=spawn_method,
+                cpu_affinity=cpu_affinity,
+                memory_profile_path=memory_profile_path,
+                **worker_kwargs
+            )
+
+        self.status = None
+        self.processes = specs["processes"]
+
+        super(LocalCluster, self).__init__(
+            scheduler=specs["scheduler"],
+            # SpecCluster scales by mutating this mapping, so never share it
+            workers=dict(specs["workers"]),
+            worker=specs["worker"],
+            loop=loop,
+            asynchronous=asynchronous,
+            silence_logs=specs["silence_logs"],
+        )
+        # Fast path: SpecCluster already realizes worker_spec, either in
+        # __init__ or when awaited, so scaling to the same size only
+        # schedules a redundant _correct_state
+        n_workers = len(specs["workers"])
+        if len(self.worker_spec) != n_workers:
+            self.scale(n_workers)
+        if track_for_atexit and not asynchronous:
+            clusters_to_close.add(self)
+
+    @classmethod
+    def build_specs(
+        cls,
+        n_workers=None,
+        threads_per_worker=None,
+        processes=True,
+        host=None,
+        ip=None,
+        scheduler_port=0,
+        silence_logs=logging.WARN,
+        dashboard_address=":8787",
+        worker_dashboard_address=None,
+        diagnostics_port=None,
+        services=None,
+        worker_services=None,
+        service_kwargs=None,
+        security=None,
+        protocol=None,
+        blocked_handlers=None,
+        interface=None,
+        worker_class=None,
+        proxy_address = None,
+        proxy_port = None,
+        redis_endpoints = [],
+        num_lambda_invokers = 16,
+        max_task_fanout = 10,
+        chunk_large_tasks = False,
+        chunk_task_threshold = 50,
+        num_chunks_for_large_tasks = None,
+        spawn_method=None,
+        cpu_affinity=False,
+        memory_profile_path=None,
         **worker_kwargs
     ):
+        """ Build the scheduler and worker specifications for a LocalCluster
+
+        Takes the same keywords as ``LocalCluster``, except for those about
+        running the cluster (``loop``, ``asynchronous``, ...).  The result
+        can be passed to many clusters with ``LocalCluster(specs=...)`` to
+        skip handling these keywords each time.
+
+        Examples
+        --------
+        >>> specs = LocalCluster.build_specs(n_workers=2, processes=False)
+        >>> with LocalCluster(specs=specs) as cluster:  # doctest: +SKIP
+        ...     pass
+
+        Returns
+        -------
+        Dictionary with the ``scheduler``, ``workers`` and ``worker``
+        specifications, as expected by ``SpecCluster``, along with the
+        ``processes`` and ``silence_logs`` settings of the cluster
+        """
         if ip is not None:
             warnings.warn("The ip keyword has been moved to host")
             host = ip
@@ -133,18 +288,13 @@ class LocalCluster(SpecCluster):
             )
             dashboard_address = diagnostics_port
 
-        self.status = None
-        self.processes = processes
-
         if protocol is None:
             if host and "://" in host:
                 protocol = host.split("://")[0]
-            elif security:
-                protocol = "tls://"
-            elif not self.processes and not scheduler_port:
-                protocol = "inproc://"
             else:
-                protocol = "tcp://"
+                protocol = _default_protocols[
+                    bool(security), not processes and not scheduler_port
+                ]
         if not protocol.endswith("://"):
             protocol = protocol + "://"
 
@@ -166,6 +316,11 @@ class LocalCluster(SpecCluster):
             threads_per_worker = max(1, int(math.ceil(_ncores / n_workers)))
         if n_workers and "memory_limit" not in worker_kwargs:
             worker_kwargs["memory_limit"] = parse_memory_limit("auto", 1, n_workers)
+        if memory_profile_path is not None:
+            sampler = MemorySampler(memory_profile_path)
+            sampler.create_file()
+            plugins = list(worker_kwargs.get("plugins", ()))
+            worker_kwargs["plugins"] = plugins + [sampler]
 
         worker_kwargs.update(
             {
@@ -202,28 +357,47 @@ class LocalCluster(SpecCluster):
             ),
         }
 
-        worker = {
-            "cls": worker_class or (Worker if not processes else Nanny),
-            "options": worker_kwargs,
+        worker_class = worker_class or (Worker if not processes else Nanny)
+        if spawn_method is not None:
+            # Validate the method even when workers run in this process
+            mp_context = get_mp_context(spawn_method)
+            if issubclass(worker_class, Nanny):
+                worker_kwargs["mp_context"] = mp_context
+
+        # Every worker shares this one spec, so make its options read-only.
+        # SpecCluster only takes a shallow copy when adding the worker name
+        worker = {"cls": worker_class, "options": MappingProxyType(worker_kwargs)}
+
+        if (
+            cpu_affinity
+            and issubclass(worker_class, Nanny)
+            and hasattr(psutil.Process, "cpu_affinity")
+        ):
+            workers = {
+                i: {
+                    "cls": worker_class,
+                    "options": MappingProxyType(dict(worker_kwargs, cpu_affinity=cpus)),
+                }
+                for i, cpus in enumerate(cpu_affinities(n_workers, threads_per_worker))
+            }
+        else:
+            workers = dict.fromkeys(range(n_workers), worker)
+
+        return {
+            "scheduler": scheduler,
+            "workers": workers,
+            "worker": worker,
+            "processes": processes,
+            "silence_logs": silence_logs,
         }
 
-        workers = {i: worker for i in range(n_workers)}
-
-        super(LocalCluster, self).__init__(
-            scheduler=scheduler,
-            workers=workers,
-            worker=worker,
-            loop=loop,
-            asynchronous=asynchronous,
-            silence_logs=silence_logs,
-        )
-        self.scale(n_workers)
-
 
 def nprocesses_nthreads(n):
     """
     The default breakdown of processes and threads for a given number of cores
 
+    This is a pure function of ``n``, so results are cached across calls
+
     Parameters
     ----------
     n: int
@@ -243,15 +417,76 @@ def nprocesses_nthreads(n):
     if n <= 4:
         processes = n
     else:
-        processes = min(f for f in factors(n) if f >= math.sqrt(n))
+        # Compare squares to avoid float sqrt; equivalent to f >= sqrt(n)
+        processes = next(f for f in sorted(factors(n)) if f * f >= n)
     threads = n // processes
     return (processes, threads)
 
 
+if lru_cache:
+    nprocesses_nthreads = lru_cache(None)(nprocesses_nthreads)
+
+
+def cpu_affinities(n_workers, threads_per_worker, cpus=None):
+    """
+    Assign each worker its own block of ``threads_per_worker`` cores
+
+    Blocks are taken in order from the cores available to this process,
+    wrapping around when there are more threads than cores
+
+    Parameters
+    ----------
+    n_workers: int
+    threads_per_worker: int
+    cpus: List[int], optional
+        Available cores.  Defaults to the current CPU affinity of this process
+
+    Examples
+    --------
+    >>> cpu_affinities(2, 2, cpus=[0, 1, 2, 3])
+    [[0, 1], [2, 3]]
+    >>> cpu_affinities(3, 1, cpus=[0, 1])
+    [[0], [1], [0]]
+
+    Returns
+    -------
+    List of lists of cores, one per worker
+    """
+    if cpus is None:
+        cpus = sorted(psutil.Process().cpu_affinity())
+    return [
+        sorted(
+            {
+                cpus[(i * threads_per_worker + j) % len(cpus)]
+                for j in range(threads_per_worker)
+            }
+        )
+        for i in range(n_workers)
+    ]
+
+
 clusters_to_close = weakref.WeakSet()
 
 
 @atexit.register
-def close_clusters():
-    for cluster in list(clusters_to_close):
-        cluster.close(timeout=10)
+def close_clusters(timeout=10):
+    """ Close all remaining clusters concurrently
+
+    Each cluster closes on its own event loop from a separate thread, so
+    exiting takes as long as the slowest cluster rather than their sum.
+    We give up on any cluster still closing after ``timeout`` seconds.
+    Asynchronous clusters are skipped, their ``close`` only returns a
+    coroutine that nothing would run.
+    """
+    threads = [
+        threading.Thread(target=cluster.close, name="Close LocalCluster")
+        for cluster in list(clusters_to_close)
+        if cluster.status not in ("closing", "closed") and not cluster.asynchronous
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    deadline = time() + timeout
+    for thread in threads:
+        thread.join(max(0, deadline - time()))
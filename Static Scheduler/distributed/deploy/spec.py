@@ -6,6 +6,7 @@ from tornado import gen
 from .cluster import Cluster
 from ..utils import LoopRunner, silence_logging, ignoring
 from ..scheduler import Scheduler
+from ..worker import _ncores
 
 
 class SpecCluster(Cluster):
@@ -190,12 +191,19 @@ class SpecCluster(Cluster):
                 self._created.add(worker)
                 workers.append(worker)
             if workers:
-                await asyncio.wait(workers)
-                for w in workers:
-                    w._cluster = weakref.ref(self)
-                    await w  # for tornado gen.coroutine support
+                # Start all new workers concurrently, but don't launch more
+                # at once than we have cores to avoid thrashing on large scale-ups
+                semaphore = asyncio.Semaphore(min(len(workers), _ncores))
+                await asyncio.gather(
+                    *[self._start_worker(w, semaphore) for w in workers]
+                )
             self.workers.update(dict(zip(to_open, workers)))
 
+    async def _start_worker(self, worker, semaphore):
+        async with semaphore:
+            await worker
+        worker._cluster = weakref.ref(self)
+
     def __await__(self):
         async def _():
             if self.status == "created":
@@ -1,4 +1,5 @@
 from distributed import LocalCluster
+from distributed.deploy.local import clusters_to_close
 from distributed.utils_test import loop  # noqa: F401
 
 import pytest
@@ -11,3 +12,11 @@ async def test_async_with():
         assert w
 
     assert not w
+
+
+@pytest.mark.asyncio
+async def test_async_not_tracked_for_atexit():
+    async with LocalCluster(
+        n_workers=0, processes=False, dashboard_address=None, asynchronous=True
+    ) as cluster:
+        assert cluster not in clusters_to_close
@@ -2,6 +2,8 @@ from __future__ import print_function, division, absolute_import
 
 from functools import partial
 import gc
+import inspect
+import os
 import subprocess
 import sys
 from time import sleep
@@ -14,7 +16,14 @@ from tornado import gen
 import pytest
 
 from distributed import Client, Worker, Nanny
-from distributed.deploy.local import LocalCluster, nprocesses_nthreads
+from distributed.deploy import local
+from distributed.deploy.local import (
+    LocalCluster,
+    nprocesses_nthreads,
+    cpu_affinities,
+    clusters_to_close,
+    close_clusters,
+)
 from distributed.metrics import time
 from distributed.utils_test import (
     clean,
@@ -729,6 +738,117 @@ def test_default_process_thread_breakdown():
     assert nprocesses_nthreads(80) in ((10, 8), (16, 5))
 
 
+def test_close_clusters(loop, monkeypatch):
+    clusters = [
+        LocalCluster(
+            n_workers=1,
+            processes=False,
+            scheduler_port=0,
+            dashboard_address=None,
+            loop=loop,
+            track_for_atexit=False,
+        )
+        for _ in range(2)
+    ]
+    monkeypatch.setattr(local, "clusters_to_close", weakref.WeakSet(clusters))
+    close_clusters()
+    assert all(cluster.status == "closed" for cluster in clusters)
+
+
+class SlowClosingCluster(object):
+    status = "running"
+    asynchronous = False
+
+    def close(self):
+        sleep(0.5)
+        self.status = "closed"
+
+
+def test_close_clusters_concurrently(monkeypatch):
+    clusters = [SlowClosingCluster() for _ in range(4)]
+    monkeypatch.setattr(local, "clusters_to_close", weakref.WeakSet(clusters))
+    start = time()
+    close_clusters()
+    assert time() - start < 1.5
+    assert all(cluster.status == "closed" for cluster in clusters)
+
+
+def test_close_clusters_skips_asynchronous(monkeypatch):
+    cluster = SlowClosingCluster()
+    cluster.asynchronous = True
+    monkeypatch.setattr(local, "clusters_to_close", weakref.WeakSet([cluster]))
+    close_clusters()
+    assert cluster.status == "running"
+
+
+def test_track_for_atexit(loop):
+    kwargs = dict(
+        n_workers=0, processes=False, scheduler_port=0, dashboard_address=None
+    )
+    with LocalCluster(loop=loop, **kwargs) as cluster:
+        assert cluster in clusters_to_close
+    with LocalCluster(loop=loop, track_for_atexit=False, **kwargs) as cluster:
+        assert cluster not in clusters_to_close
+
+
+def test_build_specs(loop):
+    specs = LocalCluster.build_specs(
+        n_workers=2, processes=False, scheduler_port=0, dashboard_address=None
+    )
+    for _ in range(2):
+        with LocalCluster(specs=specs, loop=loop) as cluster:
+            assert not cluster.processes
+            assert len(cluster.workers) == 2
+            cluster.scale(3)
+            assert len(cluster.worker_spec) == 3
+    # Scaling a cluster does not affect the shared specs
+    assert len(specs["workers"]) == 2
+
+
+def test_build_specs_signature():
+    init = inspect.signature(LocalCluster.__init__).parameters
+    build = inspect.signature(LocalCluster.build_specs).parameters
+    for name, param in build.items():
+        if name == "cls":
+            continue
+        assert init[name].default == param.default, name
+    assert set(init) - set(build) == {
+        "self",
+        "loop",
+        "start",
+        "asynchronous",
+        "track_for_atexit",
+        "specs",
+    }
+
+
+def test_cpu_affinities():
+    assert cpu_affinities(2, 2, cpus=[0, 1, 2, 3]) == [[0, 1], [2, 3]]
+    assert cpu_affinities(3, 1, cpus=[0, 1]) == [[0], [1], [0]]
+    assert cpu_affinities(1, 3, cpus=[4, 6]) == [[4, 6]]
+    assert cpu_affinities(0, 2, cpus=[0, 1]) == []
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="CPU affinity is Linux specific"
+)
+def test_cpu_affinity(loop):
+    with LocalCluster(
+        n_workers=2,
+        threads_per_worker=1,
+        cpu_affinity=True,
+        loop=loop,
+        scheduler_port=0,
+        dashboard_address=None,
+    ) as cluster:
+        with Client(cluster) as client:
+            expected = {
+                w.worker_address: w.cpu_affinity for w in cluster.workers.values()
+            }
+            actual = client.run(lambda: sorted(os.sched_getaffinity(0)))
+            assert actual == expected
+
+
 def test_asynchronous_property(loop):
     with LocalCluster(
         4,
@@ -798,6 +918,42 @@ def test_worker_class_nanny(loop):
         assert all(isinstance(w, MyNanny) for w in cluster.workers.values())
 
 
+def test_spawn_method(loop):
+    with LocalCluster(
+        n_workers=1,
+        loop=loop,
+        spawn_method="spawn",
+        scheduler_port=0,
+        dashboard_address=None,
+    ) as cluster:
+        (nanny,) = cluster.workers.values()
+        assert nanny.mp_context.get_start_method() == "spawn"
+        assert nanny.process.mp_context is nanny.mp_context
+
+
+def test_spawn_method_invalid():
+    for processes in [True, False]:
+        with pytest.raises(ValueError):
+            LocalCluster.build_specs(
+                n_workers=1, processes=processes, spawn_method="bogus"
+            )
+
+
+def test_worker_spec_is_shared(loop):
+    with LocalCluster(
+        n_workers=3,
+        loop=loop,
+        processes=False,
+        scheduler_port=0,
+        dashboard_address=None,
+    ) as cluster:
+        specs = list(cluster.worker_spec.values())
+        assert all(spec is cluster.new_spec for spec in specs)
+        with pytest.raises(TypeError):
+            cluster.new_spec["options"]["ncores"] = 100
+        assert sorted(w.name for w in cluster.workers.values()) == [0, 1, 2]
+
+
 @pytest.mark.asyncio
 async def test_worker_class_nanny_async():
     class MyNanny(Nanny):
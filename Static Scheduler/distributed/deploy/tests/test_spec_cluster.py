@@ -1,4 +1,4 @@
-from dask.distributed import SpecCluster, Worker, Client, Scheduler
+from dask.distributed import SpecCluster, Worker, Client, Scheduler, Nanny
 from distributed.utils_test import loop  # noqa: F401
 import pytest
 
@@ -103,6 +103,29 @@ async def test_scale():
         assert len(cluster.workers) == 1
 
 
+@pytest.mark.asyncio
+async def test_nannies():
+    worker_spec = {
+        0: {"cls": Nanny, "options": {"ncores": 1}},
+        1: {"cls": Nanny, "options": {"ncores": 2}},
+    }
+    async with SpecCluster(
+        workers=worker_spec, scheduler=scheduler, asynchronous=True
+    ) as cluster:
+        assert len(cluster.workers) == 2
+        assert all(isinstance(w, Nanny) for w in cluster.workers.values())
+        addresses = {name: w.address for name, w in cluster.workers.items()}
+
+        # Awaiting again does not restart the nannies
+        await cluster
+        assert {name: w.address for name, w in cluster.workers.items()} == addresses
+        assert len(cluster.scheduler.workers) == 2
+
+        async with Client(cluster, asynchronous=True) as client:
+            result = await client.submit(lambda x: x + 1, 10)
+            assert result == 11
+
+
 @pytest.mark.asyncio
 async def test_broken_worker():
     with pytest.raises(Exception) as info:
@@ -0,0 +1,154 @@
+from __future__ import print_function, division, absolute_import
+
+import csv
+import io
+import logging
+import os
+import threading
+
+import psutil
+
+from ..utils import parse_timedelta
+
+logger = logging.getLogger(__name__)
+
+try:
+    _page_size = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError):
+    _page_size = None
+
+HEADER = ("task_key", "min_memory_mb", "max_memory_mb")
+
+
+class RSSReader(object):
+    """ Read the resident memory of the current process
+
+    On Linux this reads ``/proc/self/statm`` through a file descriptor that
+    stays open for the lifetime of the reader, which takes a couple of
+    microseconds rather than the much longer round trip through psutil.
+    Elsewhere we fall back to psutil.
+
+    Examples
+    --------
+    >>> read_rss = RSSReader()
+    >>> read_rss()  # doctest: +SKIP
+    83927040
+    >>> read_rss.close()
+    """
+
+    def __init__(self):
+        self._fd = None
+        if _page_size and hasattr(os, "pread"):
+            try:
+                self._fd = os.open("/proc/self/statm", os.O_RDONLY)
+            except OSError:
+                pass
+        if self._fd is None:
+            self._proc = psutil.Process()
+
+    def __call__(self):
+        if self._fd is None:
+            return self._proc.memory_info().rss
+        # "size resident shared text lib data dt", all in pages
+        return int(os.pread(self._fd, 64, 0).split()[1]) * _page_size
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class MemorySampler(object):
+    """ Worker plugin recording how much memory each task used
+
+    A background thread samples the resident memory of the worker process
+    every ``interval`` and attributes each sample to all tasks executing at
+    that moment.  When the worker closes it appends one
+    ``task_key,min_memory_mb,max_memory_mb`` row per task to the CSV file at
+    ``path``, the same format as the dask-memusage scheduler plugin.
+
+    Memory is measured for the whole process, so tasks running at the same
+    time in one process share their samples.  Tasks shorter than
+    ``interval`` may not be recorded at all.
+
+    Parameters
+    ----------
+    path: str
+        CSV file to which rows are appended.  See ``create_file``
+    interval: str or float
+        Time between samples, like ``"5ms"``
+
+    Examples
+    --------
+    >>> plugin = MemorySampler("memory.csv")
+    >>> plugin.create_file()  # doctest: +SKIP
+    >>> worker = Worker(scheduler_address, plugins=[plugin])  # doctest: +SKIP
+
+    See Also
+    --------
+    distributed.deploy.local.LocalCluster: ``memory_profile_path=`` keyword
+    """
+
+    name = "memory-sampler"
+
+    def __init__(self, path, interval="5ms"):
+        self.path = path
+        self.interval = parse_timedelta(interval, default="ms")
+        self._samplers = {}
+
+    def create_file(self):
+        """ Truncate ``path`` and write the CSV header """
+        with open(self.path, "w") as f:
+            csv.writer(f).writerow(HEADER)
+
+    def setup(self, worker):
+        stop = threading.Event()
+        usage = {}
+        thread = threading.Thread(
+            target=self._sample,
+            args=(worker, stop, usage),
+            name="MemorySampler %s" % worker.name,
+        )
+        thread.daemon = True
+        # In-process workers can share a single plugin, so keep state per worker
+        self._samplers[id(worker)] = (thread, stop, usage)
+        thread.start()
+
+    def teardown(self, worker):
+        try:
+            thread, stop, usage = self._samplers.pop(id(worker))
+        except KeyError:
+            return
+        stop.set()
+        # The thread exits within one interval, after which usage is ours
+        thread.join()
+
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for key, (low, high) in list(usage.items()):
+            writer.writerow([key, low / 2 ** 20, high / 2 ** 20])
+        # One append per worker keeps rows from different processes whole
+        with open(self.path, "a") as f:
+            f.write(buf.getvalue())
+
+    def _sample(self, worker, stop, usage):
+        read_rss = RSSReader()
+        try:
+            while not stop.wait(self.interval):
+                rss = read_rss()
+                try:
+                    executing = list(worker.executing)
+                except RuntimeError:  # set changed size during iteration
+                    continue
+                for key in executing:
+                    try:
+                        low, high = usage[key]
+                    except KeyError:
+                        usage[key] = (rss, rss)
+                    else:
+                        if rss < low or rss > high:
+                            usage[key] = (min(low, rss), max(high, rss))
+        except Exception:
+            logger.exception("Memory sampling failed")
+        finally:
+            read_rss.close()
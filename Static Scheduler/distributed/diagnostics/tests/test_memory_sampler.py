@@ -0,0 +1,41 @@
+from __future__ import print_function, division, absolute_import
+
+import csv
+
+import psutil
+
+from distributed import Worker
+from distributed.diagnostics.memory_sampler import HEADER, MemorySampler, RSSReader
+from distributed.utils import tmpfile
+from distributed.utils_test import gen_cluster, slowinc
+
+
+def test_rss_reader():
+    read_rss = RSSReader()
+    try:
+        rss = read_rss()
+    finally:
+        read_rss.close()
+    expected = psutil.Process().memory_info().rss
+    assert 0.5 * expected < rss < 2 * expected
+
+
+@gen_cluster(client=True, ncores=[])
+def test_memory_sampler(c, s):
+    with tmpfile("csv") as path:
+        plugin = MemorySampler(path, interval="1ms")
+        plugin.create_file()
+
+        w = yield Worker(s.address, loop=s.loop, plugins=[plugin])
+        futures = c.map(slowinc, range(3), delay=0.05, key=["a", "b", "c"])
+        yield c.gather(futures)
+        yield w.close()
+        assert not plugin._samplers
+
+        with open(path) as f:
+            rows = list(csv.reader(f))
+
+    assert tuple(rows[0]) == HEADER
+    assert {row[0] for row in rows[1:]} == {"a", "b", "c"}
+    for key, low, high in rows[1:]:
+        assert 0 < float(low) <= float(high)
@@ -26,7 +26,7 @@ from .proctitle import enable_proctitle_on_children
 from .security import Security
 from .utils import (
     get_ip,
-    mp_context,
+    get_mp_context,
     silence_logging,
     json_load_robust,
     PeriodicCallback,
@@ -77,6 +77,8 @@ class Nanny(ServerNode):
         host=None,
         port=None,
         protocol=None,
+        mp_context=None,
+        cpu_affinity=None,
         **worker_kwargs
     ):
         self.loop = loop or IOLoop.current()
@@ -105,6 +107,8 @@ class Nanny(ServerNode):
         self.preload_argv = preload_argv
         self.Worker = Worker if worker_class is None else worker_class
         self.env = env or {}
+        self.mp_context = mp_context
+        self.cpu_affinity = cpu_affinity
         self.worker_kwargs = worker_kwargs
 
         self.contact_address = contact_address
@@ -224,7 +228,15 @@ class Nanny(ServerNode):
         raise gen.Return(self)
 
     def __await__(self):
-        return self._start().__await__()
+        if self.status != "init":
+
+            @gen.coroutine  # idempotent
+            def _():
+                raise gen.Return(self)
+
+            return _().__await__()
+        else:
+            return self._start().__await__()
 
     def start(self, addr_or_port=0):
         self.loop.add_callback(self._start, addr_or_port)
@@ -285,6 +297,8 @@ class Nanny(ServerNode):
                 on_exit=self._on_exit,
                 worker=self.Worker,
                 env=self.env,
+                mp_context=self.mp_context,
+                cpu_affinity=self.cpu_affinity,
             )
 
         self.auto_restart = True
@@ -409,6 +423,8 @@ class WorkerProcess(object):
         on_exit,
         worker,
         env,
+        mp_context=None,
+        cpu_affinity=None,
     ):
         self.status = "init"
         self.silence_logs = silence_logs
@@ -419,6 +435,8 @@ class WorkerProcess(object):
         self.process = None
         self.Worker = worker
         self.env = env
+        self.mp_context = mp_context or get_mp_context()
+        self.cpu_affinity = cpu_affinity
 
         # Initialized when worker is ready
         self.worker_dir = None
@@ -436,8 +454,8 @@ class WorkerProcess(object):
             yield self.running.wait()
             raise gen.Return(self.status)
 
-        self.init_result_q = init_q = mp_context.Queue()
-        self.child_stop_q = mp_context.Queue()
+        self.init_result_q = init_q = self.mp_context.Queue()
+        self.child_stop_q = self.mp_context.Queue()
         uid = uuid.uuid4().hex
 
         self.process = AsyncProcess(
@@ -453,7 +471,9 @@ class WorkerProcess(object):
                 uid=uid,
                 Worker=self.Worker,
                 env=self.env,
+                cpu_affinity=self.cpu_affinity,
             ),
+            context=self.mp_context,
         )
         self.process.daemon = True
         self.process.set_exit_callback(self._on_exit)
@@ -593,8 +613,12 @@ class WorkerProcess(object):
         uid,
         env,
         Worker,
+        cpu_affinity=None,
     ):  # pragma: no cover
         os.environ.update(env)
+        if cpu_affinity:
+            # Pin before the worker starts any threads so that they inherit it
+            psutil.Process().cpu_affinity(cpu_affinity)
         try:
             from dask.multiprocessing import initialize_worker_process
         except ImportError:  # old Dask version
@@ -53,7 +53,9 @@ class AsyncProcess(object):
     All normally blocking methods are wrapped in Tornado coroutines.
     """
 
-    def __init__(self, loop=None, target=None, name=None, args=(), kwargs={}):
+    def __init__(
+        self, loop=None, target=None, name=None, args=(), kwargs={}, context=None
+    ):
         if not callable(target):
             raise TypeError("`target` needs to be callable, not %r" % (type(target),))
         self._state = _ProcessState()
@@ -68,9 +70,10 @@ class AsyncProcess(object):
         # monitor from the child and exit when the parent goes away unexpectedly
         # (for example due to SIGKILL). This variable is otherwise unused except
         # for the assignment here.
-        parent_alive_pipe, self._keep_child_alive = mp_context.Pipe(duplex=False)
+        context = context or mp_context
+        parent_alive_pipe, self._keep_child_alive = context.Pipe(duplex=False)
 
-        self._process = mp_context.Process(
+        self._process = context.Process(
             target=self._run,
             name=name,
             args=(target, args, kwargs, parent_alive_pipe, self._keep_child_alive),
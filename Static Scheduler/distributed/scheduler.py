@@ -1787,6 +1787,9 @@ class Scheduler(ServerNode):
 
         serialized_tasks = dict()
 
+        # Read once for the whole graph rather than once per visited task.
+        max_task_fanout = self.max_task_fanout
+
         # Used just for diagnostics. We print out the largest fanout for the current workload.
         largest_fanout = 0
         largest_fanout_task_key = ""
@@ -2018,7 +2021,7 @@ class Scheduler(ServerNode):
                             
                             # Update the master list of paths.
                             paths.append(new_path)
-                if len(dependents) >= self.max_task_fanout:
+                if len(dependents) >= max_task_fanout:
                     current_path_node.use_proxy = True
             # Serialize this node. This check is redundant/unnecessary?
             if current_task.key not in tasks_to_serialized_path_node:
@@ -2262,6 +2265,25 @@ class Scheduler(ServerNode):
         client_index = val % self.num_redis_clients
         return self.redis_clients[client_index]
 
+    def missing_from_redis(self, task_states):
+        """ Return the set of the given TaskStates whose results are not stored in Redis.
+
+            The EXISTS checks are pipelined, so this costs one round trip per Redis node
+            rather than one per task."""
+        task_states_by_client = defaultdict(list)
+        for ts in task_states:
+            task_states_by_client[self.hash_ring[ts.key]].append(ts)
+
+        missing = set()
+        for redis_client, client_task_states in task_states_by_client.items():
+            pipe = redis_client.pipeline(transaction = False)
+            for ts in client_task_states:
+                pipe.exists(ts.key)
+            for ts, exists in zip(client_task_states, pipe.execute()):
+                if not exists:
+                    missing.add(ts)
+        return missing
+
     def stimulus_task_finished_lambda(self, key = None, **kwargs):
         """Mark that a particular task has finished execution on AWS Lambda """
         # print("[ {} ] Scheduler - DEBUG: Stimulus task finished executing on AWS Lambda ".format(datetime.datetime.utcnow(), key))
@@ -5003,6 +5025,7 @@ class Scheduler(ServerNode):
                     recommendations[key] = "erred"
                     return recommendations
 
+            missing = self.missing_from_redis(ts.dependencies)
             for dts in ts.dependencies:
                 dep = dts.key
                 #if not dts.who_has:
@@ -5012,7 +5035,7 @@ class Scheduler(ServerNode):
                 #    ts.waiting_on.add(dts)
                 #if self.get_redis_client(dts.key).exists(dts.key) == 0:
                 #    ts.waiting_on.add(dts)
-                if self.hash_ring[dts.key].exists(dts.key) == 0:
+                if dts in missing:
                     ts.waiting_on.add(dts)
                 if dts.state == "released":
                     recommendations[dep] = "waiting"
@@ -5056,6 +5079,7 @@ class Scheduler(ServerNode):
 
             recommendations = OrderedDict()
 
+            missing = self.missing_from_redis(ts.dependencies)
             for dts in ts.dependencies:
                 dep = dts.key
                 # If the key is not in-memory, then the result doesn't exist so this task is waiting on it.
@@ -5063,7 +5087,7 @@ class Scheduler(ServerNode):
                     # ts.waiting_on.add(dts)        
                 #if self.get_redis_client(dts.key).exists(dts.key) == 0:
                 #    ts.waiting_on.add(dts)     
-                if self.hash_ring[dts.key].exists(dts.key) == 0:
+                if dts in missing:
                     ts.waiting_on.add(dts)
                 # if not dts.who_has:
                     # ts.waiting_on.add(dep)
@@ -0,0 +1,84 @@
+from __future__ import print_function, division, absolute_import
+
+import threading
+
+import pytest
+from tornado import gen
+
+pytest.importorskip("boto3")
+
+from distributed import batched_lambda_invoker
+from distributed.batched_lambda_invoker import BatchedLambdaInvoker
+from distributed.metrics import time
+from distributed.utils_test import gen_test
+
+
+class FakeProcess(object):
+    def __init__(self, target=None, args=()):
+        pass
+
+    def start(self):
+        pass
+
+    def terminate(self):
+        pass
+
+
+class FakeConfig(object):
+    def __init__(self, max_pool_connections):
+        self.max_pool_connections = max_pool_connections
+
+
+class FakeMeta(object):
+    def __init__(self, max_pool_connections):
+        self.config = FakeConfig(max_pool_connections)
+
+
+class FakeLambdaClient(object):
+    def __init__(self, max_pool_connections):
+        self.meta = FakeMeta(max_pool_connections)
+        self.lock = threading.Lock()
+        self.invoked = []
+        self.threads = set()
+
+    def invoke(self, FunctionName, InvocationType, Payload):
+        with self.lock:
+            self.invoked.append(Payload)
+            self.threads.add(threading.current_thread().name)
+
+
+@pytest.mark.parametrize("num_invokers,max_pool_connections", [(3, 2), (2, 10)])
+def test_invoke_executor(monkeypatch, num_invokers, max_pool_connections):
+    # Don't launch the invoker processes, the Scheduler's share is enough here
+    monkeypatch.setattr(batched_lambda_invoker, "Process", FakeProcess)
+    client = FakeLambdaClient(max_pool_connections)
+
+    @gen_test()
+    def test():
+        b = BatchedLambdaInvoker(interval="10ms", num_invokers=num_invokers)
+        b.start(client, "tcp://127.0.0.1:8786")
+        try:
+            assert b.invoke_executor._max_workers == min(
+                num_invokers, max_pool_connections
+            )
+
+            msgs = ["payload-%d" % i for i in range(4 * (num_invokers + 1))]
+            for msg in msgs:
+                b.send(msg)
+
+            # The Scheduler invokes the first chunk itself, the rest go to
+            # the invoker processes
+            expected = msgs[:4]
+            start = time()
+            while len(client.invoked) < len(expected):
+                yield gen.sleep(0.01)
+                assert time() < start + 5
+            yield gen.sleep(0.05)
+            assert sorted(client.invoked) == sorted(expected)
+            assert all(
+                name.startswith("Dask-Lambda-Invoker") for name in client.threads
+            )
+        finally:
+            yield b.close()
+
+    test()
@@ -18,7 +18,7 @@ import pytest
 
 from distributed import Nanny, Worker, Client, wait, fire_and_forget
 from distributed.core import connect, rpc
-from distributed.scheduler import Scheduler
+from distributed.scheduler import Scheduler, TaskState
 from distributed.client import wait
 from distributed.metrics import time
 from distributed.protocol.pickle import dumps
@@ -1572,3 +1572,45 @@ def test_dashboard_address():
     s = yield Scheduler(dashboard_address="127.0.0.1", port=0)
     assert s.services["bokeh"].port
     yield s.close()
+
+
+class FakeRedisPipeline(object):
+    def __init__(self, client):
+        self.client = client
+        self.keys = []
+
+    def exists(self, key):
+        self.keys.append(key)
+
+    def execute(self):
+        self.client.executed.append(self.keys)
+        return [int(key in self.client.data) for key in self.keys]
+
+
+class FakeRedis(object):
+    def __init__(self, data):
+        self.data = set(data)
+        self.executed = []
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+
+class FakeScheduler(object):
+    missing_from_redis = Scheduler.missing_from_redis
+
+
+def test_missing_from_redis():
+    a = FakeRedis({"x", "y"})
+    b = FakeRedis({"z"})
+    s = FakeScheduler()
+    s.hash_ring = {"w": a, "x": a, "y": a, "z": b, "v": b}
+    tasks = {key: TaskState(key, None) for key in "vwxyz"}
+
+    missing = s.missing_from_redis(tasks.values())
+
+    assert missing == {tasks["v"], tasks["w"]}
+    # One pipelined round trip per Redis node
+    assert [sorted(keys) for keys in a.executed] == [["w", "x", "y"]]
+    assert [sorted(keys) for keys in b.executed] == [["v", "z"]]
+    assert not s.missing_from_redis([])
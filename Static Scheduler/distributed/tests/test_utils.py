@@ -3,7 +3,10 @@ from __future__ import print_function, division, absolute_import
 import datetime
 from functools import partial
 import io
+import multiprocessing
+import os
 import socket
+import subprocess
 import sys
 from time import sleep
 import traceback
@@ -38,6 +41,8 @@ from distributed.utils import (
     parse_bytes,
     parse_timedelta,
     warn_on_duration,
+    get_mp_context,
+    _forkserver_preload,
 )
 from distributed.utils_test import loop, loop_in_thread  # noqa: F401
 from distributed.utils_test import div, has_ipv6, inc, throws, gen_test, captured_logger
@@ -543,3 +548,52 @@ def test_warn_on_duration():
 
     assert record
     assert any("foo" in str(rec.message) for rec in record)
+
+
+def test_forkserver_preload():
+    # numpy is imported at the top of this module
+    preload = _forkserver_preload()
+    assert preload[0] == "distributed"
+    assert "numpy" in preload
+    assert all(mod in sys.modules for mod in preload[1:])
+
+
+@pytest.mark.skipif(
+    PY2 or sys.platform.startswith("win"), reason="no forkserver available"
+)
+def test_get_mp_context_keeps_forkserver_preload():
+    from multiprocessing import forkserver
+
+    ctx = multiprocessing.get_context("forkserver")
+    old = list(forkserver._forkserver._preload_modules)
+    try:
+        ctx.set_forkserver_preload(["json"])
+        get_mp_context("forkserver")
+        preload = forkserver._forkserver._preload_modules
+        assert preload[0] == "json"
+        assert "distributed" in preload
+
+        # Nothing left to add
+        get_mp_context("forkserver")
+        assert forkserver._forkserver._preload_modules == preload
+    finally:
+        ctx.set_forkserver_preload(old)
+
+
+@pytest.mark.skipif(PY2, reason="no multiprocessing contexts")
+def test_get_mp_context():
+    assert get_mp_context("spawn").get_start_method() == "spawn"
+    with pytest.raises(ValueError):
+        get_mp_context("not-a-method")
+
+
+@pytest.mark.skipif(PY2, reason="asyncio event loops")
+def test_uvloop_event_loop():
+    pytest.importorskip("uvloop")
+    code = (
+        "import distributed, tornado.ioloop; "
+        "print(type(tornado.ioloop.IOLoop().asyncio_loop).__module__)"
+    )
+    env = dict(os.environ, DASK_DISTRIBUTED__ADMIN__EVENT_LOOP="uvloop")
+    out = subprocess.check_output([sys.executable, "-c", code], env=env)
+    assert out.decode().startswith("uvloop")
@@ -21,7 +21,7 @@ from tornado import gen
 from tornado.ioloop import TimeoutError
 
 from distributed import Nanny, get_client, wait, default_client, get_worker, Reschedule
-from distributed.compatibility import WINDOWS, cache_from_source
+from distributed.compatibility import WINDOWS, PY2, cache_from_source
 from distributed.core import rpc
 from distributed.client import wait
 from distributed.scheduler import Scheduler
@@ -1413,6 +1413,25 @@ def test_host_address(c, s):
     yield n.close()
 
 
+def test_parse_memory_limit_int():
+    assert parse_memory_limit(1, 1, total_cores=1) == parse_memory_limit(
+        1.0, 1, total_cores=1
+    )
+    limit = parse_memory_limit("auto", 1, total_cores=4)
+    assert isinstance(limit, int)
+    assert parse_memory_limit(limit, 1, total_cores=4) == limit
+
+
+@pytest.mark.skipif(PY2, reason="no lru_cache")
+def test_parse_memory_limit_cached():
+    from distributed.worker import _parse_memory_limit
+
+    parse_memory_limit("3GB", 1, total_cores=2)
+    hits = _parse_memory_limit.cache_info().hits
+    assert parse_memory_limit("3GB", 1, total_cores=2) == 3e9
+    assert _parse_memory_limit.cache_info().hits == hits + 1
+
+
 def test_resource_limit():
     assert parse_memory_limit("250MiB", 1, total_cores=1) == 1024 * 1024 * 250
 
@@ -61,15 +61,25 @@ logger = _logger = logging.getLogger(__name__)
 no_default = "__no_default__"
 
 
+# Optional libraries that the forkserver imports once on behalf of all worker
+# processes, if the parent process has already imported them.  GPU libraries
+# like torch or cudf are deliberately left out: initializing CUDA before
+# forking breaks it in the children.
+_forkserver_preload_optional = ("pkg_resources", "numpy", "pandas")
+
+
+def _forkserver_preload():
+    preload = ["distributed"]
+    preload.extend(mod for mod in _forkserver_preload_optional if mod in sys.modules)
+    return preload
+
+
 def _initialize_mp_context():
     if PY3 and not sys.platform.startswith("win") and "PyPy" not in sys.version:
         method = dask.config.get("distributed.worker.multiprocessing-method")
         ctx = multiprocessing.get_context(method)
         # Makes the test suite much faster
-        preload = ["distributed"]
-        if "pkg_resources" in sys.modules:
-            preload.append("pkg_resources")
-        ctx.set_forkserver_preload(preload)
+        ctx.set_forkserver_preload(_forkserver_preload())
     else:
         ctx = multiprocessing
 
@@ -79,6 +89,51 @@ def _initialize_mp_context():
 mp_context = _initialize_mp_context()
 
 
+def get_mp_context(method=None):
+    """ Get a multiprocessing context for a given start method
+
+    Parameters
+    ----------
+    method: str, optional
+        One of ``"fork"``, ``"forkserver"`` or ``"spawn"``.  Defaults to the
+        context configured by ``distributed.worker.multiprocessing-method``
+
+    Examples
+    --------
+    >>> get_mp_context("spawn")  # doctest: +SKIP
+    <multiprocessing.context.SpawnContext ...>
+    """
+    if method is None:
+        ctx = mp_context
+    elif method not in multiprocessing.get_all_start_methods():
+        raise ValueError(
+            "Unsupported multiprocessing start method %r on this platform. "
+            "Expected one of %s" % (method, multiprocessing.get_all_start_methods())
+        )
+    else:
+        ctx = multiprocessing.get_context(method)
+
+    if ctx is not multiprocessing and ctx.get_start_method() == "forkserver":
+        # Include libraries imported since startup.  This only has an effect
+        # until the forkserver process is first started
+        _extend_forkserver_preload(ctx)
+    return ctx
+
+
+def _extend_forkserver_preload(ctx):
+    """ Add our modules to the forkserver preload list
+
+    Modules set by the user with ``multiprocessing.set_forkserver_preload``
+    are kept.
+    """
+    from multiprocessing import forkserver
+
+    current = list(getattr(forkserver._forkserver, "_preload_modules", ()))
+    missing = [mod for mod in _forkserver_preload() if mod not in current]
+    if missing:
+        ctx.set_forkserver_preload(current + missing)
+
+
 def funcname(func):
     """Get the name of a function."""
     while hasattr(func, "func"):
@@ -1429,9 +1484,20 @@ if "asyncio" in sys.modules and tornado.version_info[0] >= 5:
         import asyncio
         import tornado.platform.asyncio
 
-        asyncio.set_event_loop_policy(
-            tornado.platform.asyncio.AnyThreadEventLoopPolicy()
-        )
+        policy = tornado.platform.asyncio.AnyThreadEventLoopPolicy
+        if dask.config.get("distributed.admin.event-loop", "asyncio") == "uvloop":
+            try:
+                import uvloop
+            except ImportError:  # not installed, or on Windows
+                logger.warning("uvloop is not installed, using the asyncio event loop")
+            else:
+
+                class UVLoopPolicy(policy):
+                    _loop_factory = uvloop.Loop
+
+                policy = UVLoopPolicy
+
+        asyncio.set_event_loop_policy(policy())
 
 
 def has_keyword(func, keyword):
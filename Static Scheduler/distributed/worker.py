@@ -66,6 +66,7 @@ from .utils import (
     parse_timedelta,
     iscoroutinefunction,
     warn_on_duration,
+    lru_cache,
 )
 from .utils_comm import pack_data, gather_from_workers
 from .utils_perf import ThrottledGC, enable_gc_diagnosis, disable_gc_diagnosis
@@ -2975,17 +2976,7 @@ def parse_memory_limit(memory_limit, ncores, total_cores=_ncores):
     if memory_limit is None:
         return None
 
-    if memory_limit == "auto":
-        memory_limit = int(TOTAL_MEMORY * min(1, ncores / total_cores))
-    with ignoring(ValueError, TypeError):
-        memory_limit = float(memory_limit)
-        if isinstance(memory_limit, float) and memory_limit <= 1:
-            memory_limit = int(memory_limit * TOTAL_MEMORY)
-
-    if isinstance(memory_limit, (unicode, str)):
-        memory_limit = parse_bytes(memory_limit)
-    else:
-        memory_limit = int(memory_limit)
+    memory_limit = _parse_memory_limit(memory_limit, ncores, total_cores)
 
     # should be less than hard RSS limit
     try:
@@ -3000,6 +2991,36 @@ def parse_memory_limit(memory_limit, ncores, total_cores=_ncores):
     return memory_limit
 
 
+def _parse_memory_limit(memory_limit, ncores, total_cores):
+    """ Convert a memory limit to a number of bytes
+
+    This depends only on its arguments and on TOTAL_MEMORY, so results are
+    cached.  The hard RSS limit can change at runtime, so it is applied
+    separately by ``parse_memory_limit``.
+    """
+    if memory_limit == "auto":
+        memory_limit = int(TOTAL_MEMORY * min(1, ncores / total_cores))
+
+    # Integer byte counts, like those precomputed by LocalCluster, are
+    # already parsed
+    if not (isinstance(memory_limit, int) and memory_limit > 1):
+        with ignoring(ValueError, TypeError):
+            memory_limit = float(memory_limit)
+            if isinstance(memory_limit, float) and memory_limit <= 1:
+                memory_limit = int(memory_limit * TOTAL_MEMORY)
+
+        if isinstance(memory_limit, (unicode, str)):
+            memory_limit = parse_bytes(memory_limit)
+        else:
+            memory_limit = int(memory_limit)
+
+    return memory_limit
+
+
+if lru_cache:
+    _parse_memory_limit = lru_cache(32, typed=True)(_parse_memory_limit)
+
+
 @gen.coroutine
 def get_data_from_worker(
     rpc,